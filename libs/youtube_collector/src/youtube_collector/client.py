@@ -7,21 +7,68 @@ and prevents bias via randomization.
 import csv
 import logging
 import os
-import re
 import random
+import threading
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import httplib2
+import orjson
 import requests
-from googleapiclient.discovery import build
+import xxhash
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 
 # Import config helpers (assuming config.py exists in the same folder)
 from .config import get_api_key, get_output_dir
 
 logger = logging.getLogger(__name__)
 
+# Seconds per ISO-8601 duration designator (contentDetails.duration, e.g. P1W2DT3H4M5S).
+# 'M' is minutes only after 'T'; years/months are calendar-dependent and left unparsed.
+_DURATION_UNITS = {'W': 604800, 'D': 86400, 'H': 3600, 'M': 60, 'S': 1}
+
+# Sidecar of `video_id,xxh64` lines next to downloaded thumbnails
+_HASHES_FILE = '.hashes'
+
+# search maxResults and videos().list / channels().list IDs are capped at 50 per call
+_MAX_IDS_PER_REQUEST = 50
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes API responses with orjson instead of stdlib json."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _build_youtube(api_key: str):
+    """
+    Build the YouTube v3 resource from the discovery document pinned in
+    google-api-python-client (no discovery roundtrip), parsed with orjson.
+    """
+    model = _OrjsonModel()
+    document = get_static_doc('youtube', 'v3')
+    if document is None:
+        logger.warning("No bundled youtube v3 discovery document; fetching it from the discovery service")
+        return build('youtube', 'v3', developerKey=api_key, model=model, static_discovery=False)
+    return build_from_document(orjson.loads(document), developerKey=api_key, model=model)
+
+
 class YouTubeClient:
     """
     Lightweight YouTube API client for raw data collection.
@@ -43,11 +90,30 @@ class YouTubeClient:
         'US_EU': ['US', 'GB', 'IE', 'DE', 'FR', 'NL', 'SE', 'DK', 'FI', 'NO'],
     }
 
+    # Max channels kept in the stats cache (channels repeat across categories/regions)
+    CHANNEL_CACHE_SIZE = 5000
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the YouTube client."""
         self.api_key = get_api_key(api_key)
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        self.youtube = _build_youtube(self.api_key)
         self._session = requests.Session()
+        self._channel_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._hash_lock = threading.Lock()
+        self._local = threading.local()
+        # Bound once: _extract_data runs per video. Via self, so subclasses can override the table
+        self._cat_get = self.DEFAULT_CATEGORIES.get
+
+        # Thumbnails all hit i.ytimg.com: size the pool above the download workers
+        # so keep-alive connections (and their TLS sessions) are reused, not discarded.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         logger.info("YouTube client initialized")
 
     def fetch_batch(
@@ -61,9 +127,12 @@ class YouTubeClient:
         min_view_ratio: float = 0.0,
         min_duration_seconds: int = 60,
         video_duration: str = "medium",
+        max_workers: int = 8,
     ) -> List[Dict[str, Any]]:
         """
         Fetch a batch of videos across random categories and regions.
+        (region, category) pairs are searched concurrently by `max_workers` threads;
+        their IDs are pooled so details are fetched 50 videos per call.
         """
         if isinstance(region, list):
              region_codes = region
@@ -72,127 +141,220 @@ class YouTubeClient:
         else:
              region_codes = [region]
 
-        # CRITICAL: Shuffle regions to prevent bias if quota runs out
-        random.shuffle(region_codes)
+        if categories is None:
+            categories = list(self.DEFAULT_CATEGORIES.keys())
+
+        # CRITICAL: Visit (region, category) pairs in random order to prevent bias if quota runs out
+        pairs = list(product(region_codes, categories))
+        pairs = random.sample(pairs, len(pairs))
+        target = videos_per_category * len(categories)
         
-        logger.info(f"Fetching batch (regions={len(region_codes)}, days_ago={days_ago})")
+        logger.info(f"Fetching batch (regions={len(region_codes)}, days_ago={days_ago}, target={target})")
+
+        published_after, published_before = self._published_window(days_ago)
 
-        all_videos = []
+        # Deduplicate by video_id while filtering, in a single pass
+        unique_videos: Dict[str, Dict[str, Any]] = {}
         
         # Calculate per-region limit to maintain total count roughly
         per_region_limit = max(1, videos_per_category // max(len(region_codes), 1))
 
-        for region_code in region_codes:
+        # Set on quota errors or once the batch is full: queued pairs then skip their searches
+        stop = threading.Event()
+        # Set on 403/429 only: no further calls of any kind are worth making
+        quota_hit = threading.Event()
+
+        def collect(video_ids: List[str]) -> None:
+            """Fetch details for up to 50 IDs (drawn from several searches) and keep the good ones."""
             try:
-                videos = self._fetch_videos_by_date(
-                    days_ago=days_ago,
-                    max_results=per_region_limit,
-                    categories=categories,
-                    region_code=region_code,
-                    min_duration=min_duration_seconds,
-                    duration_filter=video_duration,
-                )
-                all_videos.extend(videos)
+                videos = self._fetch_details(video_ids, min_duration=min_duration_seconds)
             except HttpError as e:
                 if e.resp.status in [403, 429]:
-                    logger.warning(f"Quota exceeded or rate limit hit on region {region_code}. Stopping batch.")
-                    break
+                    if not quota_hit.is_set():
+                        logger.warning("Quota exceeded or rate limit hit fetching video details. Stopping batch.")
+                    quota_hit.set()
+                    stop.set()
                 else:
-                    logger.error(f"Error fetching region {region_code}: {e}")
-                    continue
+                    logger.error(f"Error fetching details for {len(video_ids)} videos: {e}")
+                return
+            except Exception as e:
+                logger.error(f"Unexpected error fetching details for {len(video_ids)} videos: {e}")
+                return
 
-        # Deduplicate by video_id
-        seen = set()
-        unique_videos = []
-        for v in all_videos:
-            if v['video_id'] not in seen:
+            for v in videos:
+                if v['video_id'] in unique_videos:
+                    continue
                 # Late Filter: Check subs/views here
                 # Quality Control: Ensure video meets both absolute and relative view thresholds
                 required_views = max(min_views, int(v['channel_subscribers'] * min_view_ratio))
 
                 if v['channel_subscribers'] >= min_subscribers and v['views'] >= required_views:
-                    seen.add(v['video_id'])
-                    unique_videos.append(v)
+                    unique_videos[v['video_id']] = v
+
+        # IDs from completed searches, waiting to fill a 50-ID videos().list call.
+        # Regions mostly return the same videos per category: only pool IDs not seen yet.
+        pending: List[str] = []
+        seen_ids = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._search_one,
+                    region_code=region_code,
+                    category=category,
+                    published_after=published_after,
+                    published_before=published_before,
+                    max_results=per_region_limit,
+                    duration_filter=video_duration,
+                    stop=stop,
+                ): (region_code, category)
+                for region_code, category in pairs
+            }
+
+            for future in as_completed(futures):
+                region_code, category = futures[future]
+                try:
+                    video_ids = future.result()
+                except HttpError as e:
+                    if e.resp.status in [403, 429]:
+                        if not quota_hit.is_set():
+                            logger.warning(f"Quota exceeded or rate limit hit on region {region_code}, category {category}. Stopping batch.")
+                        quota_hit.set()
+                        stop.set()
+                    else:
+                        logger.error(f"Error fetching region {region_code}, category {category}: {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Unexpected error in region {region_code}, category {category}: {e}")
+                    continue
+
+                new_ids = [i for i in dict.fromkeys(video_ids) if i not in seen_ids]
+                seen_ids.update(new_ids)
+                pending.extend(new_ids)
+
+                while len(pending) >= _MAX_IDS_PER_REQUEST and not stop.is_set():
+                    collect(pending[:_MAX_IDS_PER_REQUEST])
+                    del pending[:_MAX_IDS_PER_REQUEST]
+
+                    # Stop paying 100 quota per search once the batch is full
+                    if len(unique_videos) >= target:
+                        stop.set()
+
+        # Remainder (< 50 IDs, or left over when the batch filled up): details cost 1 quota,
+        # still worth keeping - unless the quota is gone, where each call would just 403 again
+        if pending and len(unique_videos) < target:
+            for start in range(0, len(pending), _MAX_IDS_PER_REQUEST):
+                if quota_hit.is_set():
+                    break
+                collect(pending[start:start + _MAX_IDS_PER_REQUEST])
 
         logger.info(f"Fetched {len(unique_videos)} unique videos")
-        return unique_videos
+        return list(unique_videos.values())
 
-    def _fetch_videos_by_date(
-        self,
-        days_ago: int,
-        max_results: int,
-        categories: Optional[List[str]],
-        region_code: str,
-        min_duration: int,
-        duration_filter: str,
-    ) -> List[Dict[str, Any]]:
-        
+    def _published_window(self, days_ago: int) -> Tuple[str, str]:
+        """RFC 3339 bounds covering the whole day `days_ago` days back."""
         target_date = datetime.now() - timedelta(days=days_ago)
         published_after = target_date.replace(hour=0, minute=0, second=0).isoformat() + 'Z'
         published_before = target_date.replace(hour=23, minute=59, second=59).isoformat() + 'Z'
+        return published_after, published_before
 
-        if categories is None:
-            categories = list(self.DEFAULT_CATEGORIES.keys())
+    def _search_one(
+        self,
+        region_code: str,
+        category: str,
+        published_after: str,
+        published_before: str,
+        max_results: int,
+        duration_filter: str,
+        stop: Optional[threading.Event] = None,
+    ) -> List[str]:
+        """Search one (region, category) pair and return its video IDs. Raises HttpError.
 
-        # CRITICAL: Shuffle categories to prevent bias
-        random.shuffle(categories)
+        A 403/429 sets `stop` before re-raising, so searches already queued in other
+        workers skip straight away instead of waiting for the caller to see the error.
+        """
+        if stop is not None and stop.is_set():
+            return []
+
+        # Search (Costs 100 quota)
+        try:
+            search_response = self.youtube.search().list(
+                part="id",
+                publishedAfter=published_after,
+                publishedBefore=published_before,
+                maxResults=min(max_results, _MAX_IDS_PER_REQUEST),
+                order="date", # Random-ish sampling (newest)
+                type="video",
+                videoCategoryId=category,
+                regionCode=region_code,
+                videoDuration=duration_filter,
+            ).execute(http=self._thread_http())
+        except HttpError as e:
+            if stop is not None and e.resp.status in [403, 429]:
+                stop.set()
+            raise
+
+        return [item['id']['videoId'] for item in search_response.get('items', [])]
+
+    def _fetch_details(self, video_ids: List[str], min_duration: int) -> List[Dict[str, Any]]:
+        """Detail up to 50 video IDs (2 quota at most) into extracted records. Raises HttpError."""
+        # 1. Get Video Details (Costs 1 quota)
+        videos = self._fetch_video_details(video_ids)
+        if not videos:
+            return []
+
+        # 2. Get Channel Details (Costs 1 quota, skipped when every channel is cached)
+        channel_stats = self._fetch_channel_stats(
+            list(dict.fromkeys(v['snippet']['channelId'] for v in videos))
+        )
 
+        # 3. Extract Data
         results = []
+        for item in videos:
+            data = self._extract_data(item, channel_stats)
+            if data['duration_seconds'] >= min_duration:
+                results.append(data)
 
-        for category in categories:
-            try:
-                # 1. Search (Costs 100 quota)
-                search_response = self.youtube.search().list(
-                    part="id",
-                    publishedAfter=published_after,
-                    publishedBefore=published_before,
-                    maxResults=max_results,
-                    order="date", # Random-ish sampling (newest)
-                    type="video",
-                    videoCategoryId=category,
-                    regionCode=region_code,
-                    videoDuration=duration_filter,
-                ).execute()
-
-                video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-                if not video_ids: continue
-
-                # 2. Get Video Details (Costs 1 quota)
-                videos_response = self.youtube.videos().list(
-                    part="snippet,statistics,contentDetails",
-                    id=','.join(video_ids)
-                ).execute()
-
-                # 3. Get Channel Details (Costs 1 quota)
-                channel_ids = list(set(v['snippet']['channelId'] for v in videos_response['items']))
-                channels_response = self.youtube.channels().list(
-                    part="statistics",
-                    id=','.join(channel_ids)
-                ).execute()
-
-                # Store full channel stats object
-                channel_stats = {
-                    c['id']: c['statistics']
-                    for c in channels_response['items']
-                }
-
-                # 4. Extract Data
-                for item in videos_response['items']:
-                    data = self._extract_data(item, channel_stats)
-                    if data['duration_seconds'] >= min_duration:
-                        results.append(data)
+        return results
 
-            except HttpError as e:
-                # Bubble up quota errors to stop the main loop
-                if e.resp.status in [403, 429]:
-                    raise e
-                logger.error(f"Error in category {category}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error in category {category}: {e}")
-                continue
+    def _thread_http(self) -> httplib2.Http:
+        """httplib2.Http is not thread-safe: give each worker thread its own."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = build_http()
+        return http
+
+    def _fetch_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch video resources for at most 50 IDs in one call."""
+        videos_response = self.youtube.videos().list(
+            part="snippet,statistics,contentDetails",
+            id=','.join(video_ids)
+        ).execute(http=self._thread_http())
+        return videos_response.get('items', [])
+
+    def _fetch_channel_stats(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return statistics for at most 50 channels, only querying channels
+        missing from the cache.
+        """
+        with self._cache_lock:
+            missing = [cid for cid in channel_ids if cid not in self._channel_cache]
 
-        return results
+        if missing:
+            channels_response = self.youtube.channels().list(
+                part="statistics",
+                id=','.join(missing)
+            ).execute(http=self._thread_http())
+
+            with self._cache_lock:
+                for c in channels_response.get('items', []):
+                    if len(self._channel_cache) >= self.CHANNEL_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        self._channel_cache.pop(next(iter(self._channel_cache)))
+                    self._channel_cache[c['id']] = c['statistics']
+
+        with self._cache_lock:
+            return {cid: self._channel_cache[cid] for cid in channel_ids if cid in self._channel_cache}
 
     def _extract_data(self, video: Dict, channel_stats: Dict) -> Dict[str, Any]:
         """Extract raw metadata including tags and channel context."""
@@ -204,24 +366,30 @@ class YouTubeClient:
         cid = snippet['channelId']
         c_stat = channel_stats.get(cid, {})
         
+        # Hot path: bind the dict lookups used repeatedly below
+        _sg = snippet.get
+        category_id = _sg('categoryId')
+
         # Get best thumbnail
-        thumbnails = snippet.get('thumbnails', {})
+        thumbnails = _sg('thumbnails', {})
+        _tg = thumbnails.get
+        medium_url = _tg('medium', {}).get('url')
         thumb_url = (
-            thumbnails.get('maxres', {}).get('url') or
-            thumbnails.get('high', {}).get('url') or
-            thumbnails.get('medium', {}).get('url') or
+            _tg('maxres', {}).get('url') or
+            _tg('high', {}).get('url') or
+            medium_url or
             ""
         )
 
         # Tags (Top 10 only)
-        tags_list = snippet.get('tags', [])
+        tags_list = _sg('tags', [])
         tags_str = "|".join(tags_list[:10])
 
         return {
             'video_id': vid,
             'title': snippet['title'],
-            'category_id': snippet.get('categoryId'),
-            'category_name': self.DEFAULT_CATEGORIES.get(snippet.get('categoryId'), 'Unknown'),
+            'category_id': category_id,
+            'category_name': self._cat_get(category_id, 'Unknown'),
             
             # Engagement
             'views': int(stats.get('viewCount', 0)),
@@ -236,24 +404,30 @@ class YouTubeClient:
 
             # Content Metadata
             'tags': tags_str,
-            'description_len': len(snippet.get('description', '')),
+            'description_len': len(_sg('description', '')),
             'duration_seconds': self._parse_duration(content.get('duration', 'PT0S')),
             'definition': content.get('definition', 'sd'),
-            'language': snippet.get('defaultAudioLanguage', 'en'),
+            'language': _sg('defaultAudioLanguage', 'en'),
 
             # Admin
             'published_at': snippet['publishedAt'],
             'captured_at': datetime.utcnow().isoformat(),
             'video_url': f"https://www.youtube.com/watch?v={vid}",
             'thumbnail_url': thumb_url,
+            'thumbnail_url_medium': medium_url or '',
         }
 
     def download_thumbnails_bulk(
         self,
         videos: List[Dict[str, Any]],
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        max_workers: int = 32,
+        url_key: str = 'thumbnail_url',
     ) -> None:
-        """Download images using ID as filename."""
+        """
+        Download images using ID as filename (concurrently, sharing the session pool).
+        `url_key` selects the thumbnail size, e.g. 'thumbnail_url_medium' for 320x180 previews.
+        """
         if not output_dir:
             output_dir = get_output_dir()
             
@@ -262,39 +436,126 @@ class YouTubeClient:
         
         logger.info(f"Downloading {len(videos)} thumbnails...")
 
-        for v in videos:
+        # One directory listing instead of a stat() per video
+        existing = {p.stem for p in out_path.iterdir() if p.suffix == '.jpg'}
+        content_index = self._load_content_index(out_path)
+
+        # I/O bound: threads overlap network latency, requests.Session is safe to share for GETs
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for v in videos:
+                if v['video_id'] in existing: continue
+                executor.submit(self._download_one, v, out_path, url_key, content_index)
+
+    def _load_content_index(self, out_path: Path) -> Dict[int, str]:
+        """
+        Map thumbnail content hash -> first video_id seen with it, from the .hashes sidecar.
+        Duplicates are recorded there too (and symlinked to the original's .jpg).
+        """
+        index: Dict[int, str] = {}
+        sidecar = out_path / _HASHES_FILE
+        if sidecar.exists():
+            for line in sidecar.read_text().splitlines():
+                video_id, _, digest = line.partition(',')
+                if digest:
+                    index.setdefault(int(digest), video_id)
+        return index
+
+    def _download_one(
+        self,
+        v: Dict[str, Any],
+        out_path: Path,
+        url_key: str,
+        content_index: Dict[int, str],
+    ) -> None:
+        """Download a single thumbnail, logging (not raising) failures."""
+        try:
+            url = v.get(url_key)
+            if not url: return
+            
+            filename = f"{v['video_id']}.jpg"
+            filepath = out_path / filename
+
+            # Stream straight to disk instead of buffering the whole JPEG in resp.content.
+            # Write to .part first so an interrupted transfer never looks like a finished .jpg.
+            partial = filepath.with_suffix('.part')
             try:
-                if not v['thumbnail_url']: continue
-                
-                filename = f"{v['video_id']}.jpg"
-                filepath = out_path / filename
-                
-                if filepath.exists(): continue
-
-                resp = self._session.get(v['thumbnail_url'], timeout=10)
-                resp.raise_for_status()
-                
-                with open(filepath, 'wb') as f:
-                    f.write(resp.content)
-                    
-            except Exception as e:
-                logger.warning(f"Failed {v['video_id']}: {e}")
+                hasher = xxhash.xxh64()
+                with self._session.get(url, stream=True, timeout=10) as resp:
+                    resp.raise_for_status()
+                    resp.raw.decode_content = True
+
+                    with open(partial, 'wb') as f:
+                        # Hash while streaming (xxh64 is far faster than the network)
+                        for chunk in iter(lambda: resp.raw.read(64 * 1024), b''):
+                            hasher.update(chunk)
+                            f.write(chunk)
+
+                digest = hasher.intdigest()
+                with self._hash_lock:
+                    original = content_index.setdefault(digest, v['video_id'])
+                    if original != v['video_id']:
+                        # Same image as another video: symlink so every metadata row keeps a
+                        # <video_id>.jpg; .hashes is the duplicate record (dvc add follows the
+                        # link and stores a regular file, so this saves no workspace disk)
+                        filepath.symlink_to(f"{original}.jpg")
+                        logger.info(f"Linked {v['video_id']}: same thumbnail as {original}")
+                    else:
+                        # Under the lock, so duplicates never link to a not-yet-renamed file
+                        os.replace(partial, filepath)
+                    with open(out_path / _HASHES_FILE, 'a') as f:
+                        f.write(f"{v['video_id']},{digest}\n")
+            finally:
+                # Never leave a partial file behind (it would be DVC-tracked with the batch)
+                partial.unlink(missing_ok=True)
+
+        except Exception as e:
+            logger.warning(f"Failed {v['video_id']}: {e}")
 
     def _parse_duration(self, duration: str) -> int:
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
-        if not match: return 0
-        h, m, s = match.groups()
-        return int(h or 0) * 3600 + int(m or 0) * 60 + int(s or 0)
-
-    def save_to_csv(self, videos: List[Dict[str, Any]], filename: str) -> None:
-        """Save video list to CSV."""
-        if not videos: return
+        # Single pass: accumulate digits, flush on each unit designator.
+        # Fractions are truncated (PT1.5S -> 1); unsupported units return 0 (unparsed).
+        total = 0
+        n = 0
+        in_time = False
+        in_fraction = False
+        for c in duration:
+            o = ord(c)
+            if 48 <= o <= 57:
+                if not in_fraction:
+                    n = n * 10 + o - 48
+            elif c == 'P':
+                continue
+            elif c == 'T':
+                in_time = True
+            elif c == '.' or c == ',':
+                in_fraction = True
+            else:
+                seconds = _DURATION_UNITS.get(c)
+                if seconds is None or (c == 'M' and not in_time):
+                    return 0
+                total += n * seconds
+                n = 0
+                in_fraction = False
+        return total
+
+    def save_to_csv(self, videos: List[Dict[str, Any]], filename: str) -> int:
+        """Save video list to CSV. Returns the number of rows written."""
+        if not videos: return 0
         
         file_exists = os.path.isfile(filename)
         mode = 'a' if file_exists else 'w'
 
+        fieldnames = list(videos[0].keys())
+        if file_exists:
+            # Append under the existing header so newly added fields never shift columns
+            with open(filename, 'r', newline='', encoding='utf-8') as f:
+                fieldnames = next(csv.reader(f), None) or fieldnames
+
         with open(filename, mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=videos[0].keys())
+            # Plain csv.writer on pre-ordered rows: avoids DictWriter's per-row field lookups
+            writer = csv.writer(f)
             if not file_exists:
-                writer.writeheader()
-            writer.writerows(videos)
\ No newline at end of file
+                writer.writerow(fieldnames)
+            writer.writerows([v.get(k, '') for k in fieldnames] for v in videos)
+
+        return len(videos)
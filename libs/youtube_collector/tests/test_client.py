@@ -237,3 +237,512 @@ class TestDownloadThumbnailsBulk:
         assert 'video1' in results
         assert 'video2' not in results
         assert 'video3' in results
+
+
+def _streamed_response(data):
+    """Mock a streamed requests response (context manager with a raw file-like body)."""
+    import io
+
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(data)
+    return response
+
+
+class TestDownloadThumbnailsConcurrent:
+    """Test concurrent download_thumbnails_bulk behavior."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client with a mocked HTTP session."""
+        client = YouTubeClient(api_key="test_key_12345678901234567890")
+        client._session = MagicMock()
+        return client
+
+    def test_downloads_all_and_skips_missing_urls(self, client, tmp_path):
+        """Test every video with a URL is written to disk."""
+        client._session.get.side_effect = lambda url, **kwargs: _streamed_response(url.encode())
+
+        videos = [
+            {'video_id': f'video{i}', 'thumbnail_url': f'http://example.com/{i}.jpg'}
+            for i in range(10)
+        ]
+        videos.append({'video_id': 'no_url', 'thumbnail_url': ''})
+
+        client.download_thumbnails_bulk(videos, output_dir=str(tmp_path), max_workers=4)
+
+        assert client._session.get.call_count == 10
+        assert (tmp_path / 'video0.jpg').read_bytes() == b'http://example.com/0.jpg'
+        assert not (tmp_path / 'no_url.jpg').exists()
+
+    def test_skips_existing_thumbnails(self, client, tmp_path):
+        """Test thumbnails already on disk are not requested again."""
+        (tmp_path / 'video0.jpg').write_bytes(b'old')
+        client._session.get.return_value = _streamed_response(b'new')
+
+        videos = [
+            {'video_id': 'video0', 'thumbnail_url': 'http://example.com/0.jpg'},
+            {'video_id': 'video1', 'thumbnail_url': 'http://example.com/1.jpg'},
+        ]
+
+        client.download_thumbnails_bulk(videos, output_dir=str(tmp_path))
+
+        client._session.get.assert_called_once()
+        assert (tmp_path / 'video0.jpg').read_bytes() == b'old'
+
+    def test_failures_do_not_stop_batch(self, client, tmp_path):
+        """Test a failing download is logged and the rest still complete."""
+        def side_effect(url, **kwargs):
+            if url.endswith('/1.jpg'):
+                raise Exception("Download failed")
+            return _streamed_response(url.encode())
+
+        client._session.get.side_effect = side_effect
+
+        videos = [
+            {'video_id': f'video{i}', 'thumbnail_url': f'http://example.com/{i}.jpg'}
+            for i in range(3)
+        ]
+
+        client.download_thumbnails_bulk(videos, output_dir=str(tmp_path))
+
+        assert (tmp_path / 'video0.jpg').exists()
+        assert not (tmp_path / 'video1.jpg').exists()
+        assert (tmp_path / 'video2.jpg').exists()
+
+    def test_duplicate_content_is_linked_to_original(self, client, tmp_path):
+        """Test a thumbnail identical to another video's is symlinked, not stored twice."""
+        client._session.get.side_effect = lambda url, **kwargs: _streamed_response(b'same_image')
+
+        client.download_thumbnails_bulk(
+            [{'video_id': 'video0', 'thumbnail_url': 'http://example.com/0.jpg'}], output_dir=str(tmp_path)
+        )
+        client.download_thumbnails_bulk(
+            [{'video_id': 'video1', 'thumbnail_url': 'http://example.com/1.jpg'}], output_dir=str(tmp_path)
+        )
+
+        duplicate = tmp_path / 'video1.jpg'
+        assert not (tmp_path / 'video0.jpg').is_symlink()
+        assert duplicate.is_symlink()
+        assert duplicate.resolve() == (tmp_path / 'video0.jpg').resolve()
+        assert duplicate.read_bytes() == b'same_image'
+        assert not (tmp_path / 'video1.part').exists()
+
+        hashes = [line.split(',') for line in (tmp_path / '.hashes').read_text().splitlines()]
+        assert [video_id for video_id, _ in hashes] == ['video0', 'video1']
+        assert hashes[0][1] == hashes[1][1]
+
+    def test_interrupted_stream_leaves_no_jpg(self, client, tmp_path):
+        """Test a transfer failing mid-stream is not saved as a finished thumbnail."""
+        response = _streamed_response(b'')
+        response.raw = Mock()
+        response.raw.read.side_effect = IOError("Connection reset")
+        client._session.get.return_value = response
+
+        client.download_thumbnails_bulk(
+            [{'video_id': 'video0', 'thumbnail_url': 'http://example.com/0.jpg'}], output_dir=str(tmp_path)
+        )
+
+        assert not (tmp_path / 'video0.jpg').exists()
+        assert not (tmp_path / 'video0.part').exists()
+
+
+class TestBuildYouTube:
+    """Test construction of the API resource."""
+
+    def test_builds_from_static_document(self):
+        """Test the resource is built offline with the orjson model."""
+        from youtube_collector.client import _OrjsonModel
+
+        with patch('youtube_collector.client.build') as mock_build:
+            client = YouTubeClient(api_key="test_key_12345678901234567890")
+
+        mock_build.assert_not_called()
+        assert isinstance(client.youtube._model, _OrjsonModel)
+        assert hasattr(client.youtube, 'search')
+
+    def test_falls_back_to_network_discovery(self):
+        """Test a missing bundled document falls back to the discovery service."""
+        with patch('youtube_collector.client.get_static_doc', return_value=None), \
+                patch('youtube_collector.client.build') as mock_build:
+            client = YouTubeClient(api_key="test_key_12345678901234567890")
+
+        assert mock_build.call_args.kwargs['static_discovery'] is False
+        assert client.youtube is mock_build.return_value
+
+
+class TestSessionPool:
+    """Test HTTP session configuration."""
+
+    def test_session_mounts_sized_adapter(self):
+        """Test the session pool fits the concurrent downloader."""
+        client = YouTubeClient(api_key="test_key_12345678901234567890")
+        adapter = client._session.get_adapter('https://i.ytimg.com/vi/x/hqdefault.jpg')
+
+        assert adapter._pool_maxsize >= 32
+        assert adapter.max_retries.total == 3
+
+
+class TestExtractData:
+    """Test _extract_data method."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client."""
+        return YouTubeClient(api_key="test_key_12345678901234567890")
+
+    def test_extract_data(self, client):
+        """Test fields are mapped from the video, statistics and channel resources."""
+        video = {
+            'id': 'video1',
+            'snippet': {
+                'title': 'Test Video 1',
+                'categoryId': '10',
+                'publishedAt': '2024-01-01T00:00:00Z',
+                'channelId': 'channel1',
+                'tags': [f'tag{i}' for i in range(12)],
+                'thumbnails': {
+                    'medium': {'url': 'http://example.com/mq.jpg'},
+                    'high': {'url': 'http://example.com/hq.jpg'},
+                },
+            },
+            'statistics': {'viewCount': '1000', 'likeCount': '100'},
+            'contentDetails': {'duration': 'PT4M13S', 'definition': 'hd'},
+        }
+
+        data = client._extract_data(video, {'channel1': {'subscriberCount': '50000'}})
+
+        assert data['category_name'] == 'Music'
+        assert data['views'] == 1000
+        assert data['comments'] == 0
+        assert data['channel_subscribers'] == 50000
+        assert data['tags'] == '|'.join(f'tag{i}' for i in range(10))
+        assert data['duration_seconds'] == 253
+        assert data['thumbnail_url'] == 'http://example.com/hq.jpg'
+        assert data['thumbnail_url_medium'] == 'http://example.com/mq.jpg'
+
+    def test_unknown_category(self, client):
+        """Test categories outside DEFAULT_CATEGORIES are labelled Unknown."""
+        video = {
+            'id': 'video1',
+            'snippet': {'title': 't', 'categoryId': '999', 'publishedAt': 'p', 'channelId': 'c'},
+        }
+
+        data = client._extract_data(video, {})
+
+        assert data['category_name'] == 'Unknown'
+        assert data['thumbnail_url'] == ''
+        assert data['thumbnail_url_medium'] == ''
+
+    def test_subclass_categories(self):
+        """Test a subclass overriding DEFAULT_CATEGORIES gets its own names."""
+        class CustomClient(YouTubeClient):
+            DEFAULT_CATEGORIES = {'10': 'Songs'}
+
+        client = CustomClient(api_key="test_key_12345678901234567890")
+        video = {
+            'id': 'video1',
+            'snippet': {'title': 't', 'categoryId': '10', 'publishedAt': 'p', 'channelId': 'c'},
+        }
+
+        assert client._extract_data(video, {})['category_name'] == 'Songs'
+
+
+class TestParseDuration:
+    """Test _parse_duration method."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client."""
+        return YouTubeClient(api_key="test_key_12345678901234567890")
+
+    @pytest.mark.parametrize("duration,expected", [
+        ('PT0S', 0),
+        ('PT45S', 45),
+        ('PT4M13S', 253),
+        ('PT1H', 3600),
+        ('PT1H2M3S', 3723),
+        ('PT10H0M59S', 36059),
+        ('P1DT2H', 93600),
+        ('P1W2DT3H', 788400),
+        ('P0D', 0),
+        ('PT1.5S', 1),
+        ('PT2M0,75S', 120),
+        ('P1M', 0),
+        ('P1MT5M', 0),
+        ('P1Y', 0),
+        ('', 0),
+    ])
+    def test_parse_duration(self, client, duration, expected):
+        """Test ISO-8601 durations are converted to seconds."""
+        assert client._parse_duration(duration) == expected
+
+
+class TestBatchedDetails:
+    """Test videos/channels lookups and the channel cache."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client with a mocked API resource."""
+        client = YouTubeClient(api_key="test_key_12345678901234567890")
+        client.youtube = MagicMock()
+        return client
+
+    def test_details_one_call_each(self, client):
+        """Test a chunk of IDs costs one videos().list and one channels().list call."""
+        client.youtube.videos().list().execute.return_value = {'items': [
+            {'id': f'video{i}', 'snippet': {'title': 't', 'publishedAt': 'p', 'channelId': 'channel1'},
+             'contentDetails': {'duration': 'PT5M'}}
+            for i in range(3)
+        ]}
+        client.youtube.channels().list().execute.return_value = {
+            'items': [{'id': 'channel1', 'statistics': {'subscriberCount': '10'}}]
+        }
+        client.youtube.videos().list.reset_mock()
+        client.youtube.channels().list.reset_mock()
+
+        results = client._fetch_details(['video0', 'video1', 'video2'], min_duration=60)
+
+        assert client.youtube.videos().list.call_args.kwargs['id'] == 'video0,video1,video2'
+        assert client.youtube.videos().list.call_count == 1
+        assert client.youtube.channels().list.call_count == 1
+        assert [r['channel_subscribers'] for r in results] == [10, 10, 10]
+
+    def test_channel_stats_cached(self, client):
+        """Test cached channels are not requested again."""
+        client.youtube.channels().list().execute.return_value = {
+            'items': [{'id': 'channel1', 'statistics': {'subscriberCount': '10'}}]
+        }
+        client.youtube.channels().list.reset_mock()
+
+        first = client._fetch_channel_stats(['channel1'])
+        second = client._fetch_channel_stats(['channel1'])
+
+        assert first == second == {'channel1': {'subscriberCount': '10'}}
+        assert client.youtube.channels().list.call_count == 1
+
+
+class TestFetchBatch:
+    """Test fetch_batch filtering, deduplication and pooled details."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client."""
+        return YouTubeClient(api_key="test_key_12345678901234567890")
+
+    @staticmethod
+    def _video(video_id, subscribers=50000, views=1000):
+        return {'video_id': video_id, 'channel_subscribers': subscribers, 'views': views}
+
+    def _fake_details(self, overrides=None):
+        overrides = overrides or {}
+        return lambda video_ids, min_duration: [
+            overrides.get(video_id) or self._video(video_id) for video_id in video_ids
+        ]
+
+    def test_deduplicates_and_filters(self, client):
+        """Test duplicate IDs are kept once and low-quality videos dropped."""
+        details = self._fake_details({
+            'small_channel': self._video('small_channel', subscribers=10),
+            'low_views': self._video('low_views', views=1),
+        })
+
+        with patch.object(YouTubeClient, '_search_one', return_value=['video1', 'small_channel', 'low_views']), \
+                patch.object(YouTubeClient, '_fetch_details', side_effect=details):
+            result = client.fetch_batch(region='US', min_subscribers=1000, min_view_ratio=0.001)
+
+        assert [v['video_id'] for v in result] == ['video1']
+
+    def test_searches_pooled_into_50_id_detail_calls(self, client):
+        """Test IDs from several searches share videos().list calls of 50."""
+        counter = iter(range(1000))
+
+        def fake_search(**kwargs):
+            return [f'video{next(counter)}' for _ in range(20)]
+
+        with patch.object(YouTubeClient, '_search_one', side_effect=fake_search), \
+                patch.object(YouTubeClient, '_fetch_details', side_effect=self._fake_details()) as mock_details:
+            result = client.fetch_batch(
+                videos_per_category=100, categories=['10', '20'], region=['US', 'GB', 'DE'],
+            )
+
+        # 6 searches * 20 IDs = 120 IDs -> 3 detail calls instead of 6
+        assert [len(c.args[0]) for c in mock_details.call_args_list] == [50, 50, 20]
+        assert len(result) == 120
+
+    def test_overlapping_search_ids_detailed_once(self, client):
+        """Test IDs returned by several regions are only sent to videos().list once."""
+        def fake_search(**kwargs):
+            # Same category, different regions: mostly the same videos
+            return [f'video{i}' for i in range(40)] + [f"only_{kwargs['region_code']}"]
+
+        with patch.object(YouTubeClient, '_search_one', side_effect=fake_search), \
+                patch.object(YouTubeClient, '_fetch_details', side_effect=self._fake_details()) as mock_details:
+            result = client.fetch_batch(
+                videos_per_category=100, categories=['10'], region=['US', 'GB', 'DE', 'FR', 'NL'],
+            )
+
+        sent = [video_id for c in mock_details.call_args_list for video_id in c.args[0]]
+        # 40 shared + 5 region-only IDs -> 45 distinct, one call
+        assert len(sent) == len(set(sent)) == 45
+        assert mock_details.call_count == 1
+        assert len(result) == 45
+
+    def test_stops_once_target_reached(self, client):
+        """Test queued pairs are told to stop once the batch is full."""
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return [f'video{i}' for i in range(50)]
+            # Later pairs only run after the first result was consumed
+            if kwargs['stop'].wait(timeout=5):
+                return []
+            return [f"late_{kwargs['region_code']}_{kwargs['category']}"]
+
+        with patch.object(YouTubeClient, '_search_one', side_effect=fake_search), \
+                patch.object(YouTubeClient, '_fetch_details', side_effect=self._fake_details()) as mock_details:
+            result = client.fetch_batch(
+                videos_per_category=1, categories=['10', '20'], region=['US', 'GB', 'DE'], max_workers=1,
+            )
+
+        # target = 1 video/category * 2 categories, reached by the first 50-ID detail call
+        assert len(result) == 50
+        assert not any(v['video_id'].startswith('late_') for v in result)
+        assert mock_details.call_count == 1
+
+    def test_quota_error_stops_batch(self, client):
+        """Test a 403 stops remaining pairs, keeps videos already detailed and skips the remainder."""
+        from googleapiclient.errors import HttpError
+
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return [f'video{i}' for i in range(50)]
+            if len(calls) == 2:
+                return ['pending1']
+            if len(calls) == 3:
+                raise HttpError(Mock(status=403), b'quotaExceeded')
+            return [] if kwargs['stop'].wait(timeout=5) else ['late']
+
+        with patch.object(YouTubeClient, '_search_one', side_effect=fake_search), \
+                patch.object(YouTubeClient, '_fetch_details', side_effect=self._fake_details()) as mock_details:
+            result = client.fetch_batch(
+                videos_per_category=100, categories=['10', '20'], region=['US', 'GB'], max_workers=1,
+            )
+
+        assert len(result) == 50
+        # 'pending1' never filled a call, and the remainder is not flushed into a dead quota
+        assert mock_details.call_count == 1
+
+    def test_remainder_skipped_after_detail_quota_error(self, client):
+        """Test a 403 on videos().list stops the remainder chunks too."""
+        from googleapiclient.errors import HttpError
+
+        searches = iter([[f'a{i}' for i in range(30)], [f'b{i}' for i in range(30)]])
+        with patch.object(YouTubeClient, '_search_one', side_effect=lambda **kwargs: next(searches)), \
+                patch.object(YouTubeClient, '_fetch_details',
+                             side_effect=HttpError(Mock(status=403), b'quotaExceeded')) as mock_details:
+            result = client.fetch_batch(
+                videos_per_category=100, categories=['10'], region=['US', 'GB'], max_workers=1,
+            )
+
+        assert result == []
+        assert mock_details.call_count == 1
+
+    def test_search_one_sets_stop_on_quota_error(self, client):
+        """Test a 403 from search().list stops the batch from inside the worker."""
+        import threading
+        from googleapiclient.errors import HttpError
+
+        client.youtube = MagicMock()
+        client.youtube.search.return_value.list.return_value.execute.side_effect = \
+            HttpError(Mock(status=403), b'quotaExceeded')
+        stop = threading.Event()
+
+        with pytest.raises(HttpError):
+            client._search_one(
+                region_code='US', category='10', published_after='a', published_before='b',
+                max_results=5, duration_filter='medium', stop=stop,
+            )
+
+        assert stop.is_set()
+
+    def test_search_one_skips_when_stopped(self, client):
+        """Test no search is issued for a pair queued after a stop."""
+        import threading
+
+        client.youtube = MagicMock()
+        stop = threading.Event()
+        stop.set()
+
+        result = client._search_one(
+            region_code='US', category='10', published_after='a', published_before='b',
+            max_results=5, duration_filter='medium', stop=stop,
+        )
+
+        assert result == []
+        client.youtube.search.assert_not_called()
+
+
+class TestSaveToCsv:
+    """Test save_to_csv method."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a YouTube client."""
+        return YouTubeClient(api_key="test_key_12345678901234567890")
+
+    def test_append_keeps_existing_header(self, client, tmp_path):
+        """Test rows with extra fields are appended under the original header."""
+        import csv
+
+        filename = str(tmp_path / 'metadata.csv')
+        client.save_to_csv([{'video_id': 'video1', 'title': 'One'}], filename)
+        client.save_to_csv(
+            [{'video_id': 'video2', 'thumbnail_url_medium': 'http://x', 'title': 'Two'}], filename
+        )
+
+        with open(filename, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert rows == [['video_id', 'title'], ['video1', 'One'], ['video2', 'Two']]
+
+    def test_new_file_writes_header_and_rows(self, client, tmp_path):
+        """Test a fresh file gets a header followed by one row per video."""
+        import csv
+
+        filename = str(tmp_path / 'metadata.csv')
+        written = client.save_to_csv([
+            {'video_id': 'video1', 'views': 10, 'title': 'One, with comma'},
+            {'video_id': 'video2', 'views': 20, 'title': 'Two'},
+        ], filename)
+
+        with open(filename, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert written == 2
+        assert rows == [
+            ['video_id', 'views', 'title'],
+            ['video1', '10', 'One, with comma'],
+            ['video2', '20', 'Two'],
+        ]
+
+
+class TestOrjsonModel:
+    """Test the orjson-backed response model."""
+
+    def test_deserialize_json(self):
+        """Test JSON bodies are decoded to Python objects."""
+        from youtube_collector.client import _OrjsonModel
+
+        assert _OrjsonModel().deserialize(b'{"items": [{"id": "video1"}]}') == {'items': [{'id': 'video1'}]}
+
+    def test_deserialize_non_json(self):
+        """Test non-JSON bodies are returned as text, like JsonModel."""
+        from youtube_collector.client import _OrjsonModel
+
+        assert _OrjsonModel().deserialize(b'not json') == 'not json'
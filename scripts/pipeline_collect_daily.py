@@ -1,49 +1,81 @@
 """
 Daily data collection script.
 1. Downloads HQ images to current/ for R2 (Training).
-2. Resizes images in memory for W&B (Visualization) to save space.
+2. Logs YouTube's pre-sized 'medium' thumbnails to W&B (Visualization) to save space.
 3. Prunes W&B runs > 350 to match the R2 Rolling Window.
 """
 import os
 import sys
+import tempfile
 import wandb
+from itertools import islice
 from pathlib import Path
 from PIL import Image
 import random
 from youtube_collector import YouTubeClient
+# Same directory as this script, which Python puts on sys.path when it runs
+from pipeline_rotate_batch import COUNT_FILE, NEXT_BATCH_FILE
 
 # CONSTANTS
 BATCH_LIMIT = 1000
 MAX_WANDB_RUNS = 150  # Match R2 window
 
 def count_samples(metadata_file):
+    """Samples in metadata.csv, read from the .count sidecar when present."""
+    count_file = metadata_file.parent / COUNT_FILE
+    if count_file.exists():
+        return int(count_file.read_text().strip() or 0)
     if not metadata_file.exists():
         return 0
-    with open(metadata_file, 'r', encoding='utf-8') as f:
-        return sum(1 for _ in f) - 1
+    # Fallback: count newlines in binary chunks (C-level bytes.count, no UTF-8 decode)
+    with open(metadata_file, 'rb') as f:
+        lines = sum(buf.count(b'\n') for buf in iter(lambda: f.raw.read(1 << 20), b''))
+    return max(lines - 1, 0)
+
+def wandb_preview(img_path, preview_path):
+    """W&B image for a video: the downloaded medium render, else the HQ image resized in RAM."""
+    if preview_path.exists():
+        return wandb.Image(str(preview_path))
+    with Image.open(img_path) as im:
+        # Resize to fit within a 400x400 box, MAINTAINING aspect ratio.
+        # This happens in RAM, doesn't touch the file on disk.
+        scale = min(400 / im.width, 400 / im.height)
+        # Let libjpeg decode at the smallest 1/2, 1/4, 1/8 scale still covering it (skips IDCT work)
+        im.draft('RGB', (int(im.width * scale), int(im.height * scale)))
+        im = im.convert('RGB')
+        im.thumbnail((400, 400), Image.Resampling.BILINEAR)
+        return wandb.Image(im)
 
 def get_next_batch_number(batches_dir):
+    """Next batch number from the batches/.next counter (written on rotation), else a glob scan."""
     batches_dir.mkdir(exist_ok=True)
-    existing_dvc_files = list(batches_dir.glob("batch_*.dvc"))
-    if existing_dvc_files:
-        versions = [int(f.stem.replace("batch_", "")) for f in existing_dvc_files if "batch_" in f.stem]
-        if versions:
-            return max(versions) + 1
-    return 1
+    counter_file = batches_dir / NEXT_BATCH_FILE
+    if counter_file.exists():
+        return int(counter_file.read_text().strip())
+    versions = [int(f.stem.replace("batch_", "")) for f in batches_dir.glob("batch_*.dvc")]
+    return max(versions, default=0) + 1
 
 
 def prune_old_wandb_runs(project_name, max_runs):
     """Deletes oldest runs to keep W&B storage inside the 5GB limit."""
     try:
         api = wandb.Api()
-        runs = api.runs(path=f"{api.default_entity}/{project_name}")
-        if len(runs) > max_runs:
-            runs_to_delete = len(runs) - max_runs
-            print(f"🧹 W&B Pruning: Found {len(runs)} runs. Deleting {runs_to_delete} oldest...")
-            sorted_runs = sorted(runs, key=lambda run: run.created_at)
-            for i in range(runs_to_delete):
-                print(f"   - Deleting run: {sorted_runs[i].name}")
-                sorted_runs[i].delete()
+        # Oldest first, sorted and counted server-side; never touch in-flight runs
+        runs = api.runs(
+            path=f"{api.default_entity}/{project_name}",
+            filters={"state": {"$ne": "running"}},
+            order="+created_at",
+            per_page=50,
+        )
+        # len() loads one page and returns the server-side runCount (no full listing)
+        total_runs = len(runs)
+        if total_runs > max_runs:
+            runs_to_delete = total_runs - max_runs
+            print(f"🧹 W&B Pruning: Found {total_runs} runs. Deleting {runs_to_delete} oldest...")
+            # Materialize only the head of the queue before deleting (avoids paging past it)
+            for run in list(islice(runs, runs_to_delete)):
+                print(f"   - Deleting run: {run.name}")
+                run.delete()
             print("✅ W&B Pruning Complete.")
     except Exception as e:
         print(f"⚠️ W&B Pruning failed: {e}")
@@ -111,7 +143,10 @@ def main():
         video['batch_version'] = target_batch_name
 
     metadata_file = current_dir / "metadata.csv"
-    client.save_to_csv(videos, filename=str(metadata_file))
+    # Track the running total incrementally instead of re-reading the CSV
+    previous_total = count_samples(metadata_file)
+    total = previous_total + client.save_to_csv(videos, filename=str(metadata_file))
+    (current_dir / COUNT_FILE).write_text(str(total))
 
     # 3. Log to W&B (Resized for Storage)
     try:
@@ -133,22 +168,19 @@ def main():
             "batch_version"
         ])
 
-        for video in videos:
-            img_path = current_dir / f"{video['video_id']}.jpg"
-            if img_path.exists():
-                # Metrics already calculated and in 'video' dict
+        # YouTube already hosts a 320x180 'medium' render: fetch those in parallel
+        # instead of decoding + resizing every HQ JPEG. Kept outside current/ (not DVC-tracked).
+        with tempfile.TemporaryDirectory() as preview_dir:
+            client.download_thumbnails_bulk(videos, output_dir=preview_dir, url_key='thumbnail_url_medium')
 
-                # --- RESIZING MAGIC ---
-                with Image.open(img_path) as im:
-                    # Convert to RGB
-                    im = im.convert('RGB')
-                    # Resize to fit within a 400x400 box, MAINTAINING aspect ratio.
-                    # A typical 16:9 thumbnail will become roughly 400x225 pixels.
-                    # This happens in RAM, doesn't touch the file on disk.
-                    im.thumbnail((400, 400))
+            for video in videos:
+                img_path = current_dir / f"{video['video_id']}.jpg"
+                if img_path.exists():
+                    # Metrics already calculated and in 'video' dict
+                    preview_path = Path(preview_dir) / f"{video['video_id']}.jpg"
 
                     table.add_data(
-                        wandb.Image(im),
+                        wandb_preview(img_path, preview_path),
                         video['video_id'], video['title'], video['category_id'], video['category_name'],
                         video['views'], video['likes'], video['comments'],
                         video['channel_id'], video['channel_subscribers'],
@@ -159,9 +191,9 @@ def main():
                         video['video_url'], video['thumbnail_url'],
                         target_batch_name
                     )
-                # ----------------------
 
-        wandb.log({"collected_batch": table})
+            # Log before the temp previews are removed (W&B copies files at log time)
+            wandb.log({"collected_batch": table})
         wandb.finish()
         print("✅ W&B Logging Complete")
 
@@ -174,7 +206,6 @@ def main():
         print(f"⚠️ W&B Logging/Pruning failed: {e}")
 
     # 5. Rotation Logic (R2)
-    total = count_samples(metadata_file)
     print(f"📊 Total in current/: {total}/{BATCH_LIMIT} samples")
 
     if total >= BATCH_LIMIT:
@@ -11,11 +11,17 @@ import subprocess
 from pathlib import Path
 
 MAX_BATCHES = 150
+# Sidecar names, shared with pipeline_collect_daily.py
+COUNT_FILE = ".count"  # Running sample total, lives next to metadata.csv
+NEXT_BATCH_FILE = ".next"  # Monotonic batch counter, lives in batches/
 
-def run_command(cmd, cwd=None):
-    """Runs a shell command and raises error if it fails."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, check=True, cwd=cwd, text=True)
+# Skip DVC's analytics HTTP call on every invocation
+DVC_ENV = {**os.environ, "DVC_NO_ANALYTICS": "1"}
+
+def run_command(argv, cwd=None):
+    """Runs a command (argv list, no shell) and raises error if it fails."""
+    print(f"Running: {' '.join(argv)}")
+    result = subprocess.run(argv, check=True, cwd=cwd, text=True, env=DVC_ENV)
     return result
 
 def get_rotation_flag(cwd):
@@ -30,15 +36,21 @@ def rotate_batch(cwd, batch_name):
     batch_dir = cwd / "batches" / batch_name
     
     # DVC Move (Atomic file move + stage update)
-    run_command(f"dvc move current batches/{batch_name}", cwd=cwd)
+    run_command(["dvc", "move", "current", f"batches/{batch_name}"], cwd=cwd)
     
     # Recreate current/
     current_dir = cwd / "current"
     current_dir.mkdir(exist_ok=True)
-    run_command("dvc add current/", cwd=cwd)
+    # Reset the running sample counter for the fresh batch
+    (current_dir / COUNT_FILE).write_text("0")
+    run_command(["dvc", "add", "current/"], cwd=cwd)
     
     # Push new batch to R2
-    run_command("dvc push", cwd=cwd)
+    run_command(["dvc", "push"], cwd=cwd)
+
+    # Advance the batch counter so the next run skips globbing batches/
+    batch_num = int(batch_name.replace("batch_", ""))
+    (cwd / "batches" / NEXT_BATCH_FILE).write_text(str(batch_num + 1))
 
 def prune_old_batches(cwd):
     batches_dir = cwd / "batches"
@@ -56,11 +68,11 @@ def prune_old_batches(cwd):
         print(f"Removing {oldest_name} from tracking...")
         
         # Remove from DVC
-        run_command(f"dvc remove {oldest_batch.name}", cwd=batches_dir)
+        run_command(["dvc", "remove", oldest_batch.name], cwd=batches_dir)
         
         # Garbage Collection (Delete from R2)
         print("Running DVC garbage collection to delete from R2...")
-        run_command("dvc gc --workspace --cloud --force", cwd=cwd)
+        run_command(["dvc", "gc", "--workspace", "--cloud", "--force"], cwd=cwd)
         
         print(f"✅ {oldest_name} deleted from R2 and local tracking")
     else: